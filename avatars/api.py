@@ -6,6 +6,8 @@ import logging
 import shutil
 import tempfile
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union
 from uuid import UUID
@@ -87,22 +89,31 @@ logger = logging.getLogger(__name__)
 DEFAULT_RETRY_TIMEOUT = 60
 MAX_ROWS_PER_FILE = 1_000_000
 MAX_BYTES_PER_FILE = 100 * 1024 * 1024  # 100 MB
+MAX_CONCURRENT_UPLOADS = 8
 
 PARQUET_MAGIC_BYTES = b"PAR1"
 
 T = TypeVar("T")
 
 
+# Checked in order: the first marker found in the dtype name wins
+COLUMN_TYPE_MARKERS: Tuple[Tuple[str, ColumnType], ...] = (
+    ("float", ColumnType.float),
+    ("int", ColumnType.int),
+    ("bool", ColumnType.bool),
+    ("datetime", ColumnType.datetime),
+    ("object", ColumnType.category),
+)
+CATEGORY_DTYPE_NAMES = frozenset(("category", "str"))
+
+
+@lru_cache(maxsize=None)
 def to_column_type(s: str) -> ColumnType:
-    if "float" in s:
-        return ColumnType.float
-    if "int" in s:
-        return ColumnType.int
-    if "bool" in s:
-        return ColumnType.bool
-    if "datetime" in s:
-        return ColumnType.datetime
-    if "object" in s or s == "category" or s == "str":
+    # Only a handful of distinct dtype names exist, so the scan is memoized
+    for marker, column_type in COLUMN_TYPE_MARKERS:
+        if marker in s:
+            return column_type
+    if s in CATEGORY_DTYPE_NAMES:
         return ColumnType.category
     raise TypeError(f"Unknown column type: '{s}'")
 
@@ -325,9 +336,6 @@ class Datasets:
         from_download_as_stream: bool = False,  # TODO: Remove once deprecated
     ) -> Any:
         """Download a dataset."""
-        # Download dataset metadata
-        dataset_info = self.client.datasets.get_dataset(id, timeout=timeout)
-
         if destination is None:
             warnings.warn(
                 DeprecationWarning(
@@ -340,8 +348,11 @@ class Datasets:
                 filetype = filetype or FileType.csv
             else:
                 # Download as the filetype of the dataset on the server was the old
-                # return value when using download_dataset_as_stream
-                filetype = filetype or dataset_info.filetype
+                # return value when using download_dataset_as_stream.
+                # Only fetch the dataset metadata when it is actually needed.
+                if filetype is None:
+                    dataset_info = self.client.datasets.get_dataset(id, timeout=timeout)
+                    filetype = dataset_info.filetype
         else:
             if not (isinstance(destination, str) or is_file_like(destination)):
                 raise TypeError(
@@ -1242,7 +1253,7 @@ class PandasIntegration:
         name: Optional[str] = None,
         *,
         timeout: Optional[int] = DEFAULT_TIMEOUT,
-        identifier_variables: List[str] = [],
+        identifier_variables: Optional[List[str]] = None,
         **kwargs: Dict[str, Any],  # to collect should_stream
     ) -> Dataset:
 
@@ -1256,6 +1267,9 @@ class PandasIntegration:
                 DeprecationWarning,
             )
 
+        if identifier_variables is None:
+            identifier_variables = []
+
         if not set(identifier_variables).issubset(set(request.columns)):
             missing_columns = set(identifier_variables) - set(request.columns)
             raise ValueError(
@@ -1263,7 +1277,9 @@ class PandasIntegration:
                 f" Got {missing_columns}"
             )
 
-        for col in request.columns:
+        # Only object columns can hold mixed values: a column with a concrete dtype
+        # already fully describes its values and does not need a full scan.
+        for col in request.columns[request.dtypes == object]:
             if pd.api.types.infer_dtype(request[col], skipna=True) in (
                 "mixed-integer",
                 "mixed",
@@ -1302,8 +1318,14 @@ class PandasIntegration:
         *,
         filetype: Optional[FileType] = None,
         timeout: Optional[int] = DEFAULT_TIMEOUT,
+        dataset_info: Optional[Dataset] = None,
         **kwargs: Any,  # to collect should_stream
     ) -> pd.DataFrame:
+        """Download a dataset as a dataframe.
+
+        Pass `dataset_info` when the dataset metadata is already known, e.g. from a job
+        result, to avoid fetching it again.
+        """
         if "should_stream" in kwargs:
             warnings.warn(
                 "The `should_stream` parameter is deprecated and will be removed in a future version. "
@@ -1311,7 +1333,8 @@ class PandasIntegration:
                 DeprecationWarning,
             )
 
-        dataset_info = self.client.datasets.get_dataset(id, timeout=timeout)
+        if dataset_info is None:
+            dataset_info = self.client.datasets.get_dataset(id, timeout=timeout)
 
         _filetype = filetype or dataset_info.filetype
         with tempfile.TemporaryDirectory() as download_dir:
@@ -1335,23 +1358,18 @@ class PandasIntegration:
                 warnings.warn(f"download failed: file is here: {str(tfile)}")
                 raise e
 
-        # We apply datetime columns separately as 'datetime' is not a valid pandas dtype
-        dtypes = {c.label: from_column_type(c.type) for c in dataset_info.columns or {}}
-        datetime_columns = [
-            label for label, type in dtypes.items() if type == ColumnType.datetime.value
-        ]
-
-        # Remove datetime columns
-        for label in list(dtypes.keys()):
-            if label in datetime_columns:
-                dtypes.pop(label, None)
-
-        for name, dtype in dtypes.items():
-            df[name] = df[name].astype(dtype)
-
-        df[datetime_columns] = df[datetime_columns].astype("datetime64[ns]")
+        # 'datetime' is not a valid pandas dtype, so datetime columns are mapped
+        # to 'datetime64[ns]' while building the mapping, then cast in one call
+        dtypes = {
+            c.label: (
+                "datetime64[ns]"
+                if c.type == ColumnType.datetime
+                else from_column_type(c.type)
+            )
+            for c in dataset_info.columns or []
+        }
 
-        return df
+        return df.astype(dtypes)
 
 
 class Pipelines:
@@ -1376,19 +1394,24 @@ class Pipelines:
         )
 
         # Pre process the dataframe and upload it
+        # Without processors the dataframe is unchanged, so the original dataset is reused
         processors = request.processors
-        for p in processors:
-            df = p.preprocess(df)
-        dataset = self.client.pandas_integration.upload_dataframe(
-            df, timeout=per_request_timeout
-        )
+        avatarization_dataset_id = original_dataset_id
+        if processors:
+            for p in processors:
+                df = p.preprocess(df)
+            avatarization_dataset_id = self.client.pandas_integration.upload_dataframe(
+                df, timeout=per_request_timeout
+            ).id
 
         # Avatarize the uploaded dataframe
-        request.avatarization_job_create.parameters.dataset_id = dataset.id
+        request.avatarization_job_create.parameters.dataset_id = (
+            avatarization_dataset_id
+        )
         avatarization_job = self.client.jobs.create_avatarization_job(
             request.avatarization_job_create
         )
-        logger.info(f"launching avatarization job with id={avatarization_job.id}")
+        logger.info("launching avatarization job with id=%s", avatarization_job.id)
 
         avatarization_job = self.client.jobs.get_avatarization_job(
             str(avatarization_job.id),
@@ -1411,42 +1434,49 @@ class Pipelines:
             )
 
         # Download the dataframe, postprocess it and upload the new dataframe
+        # The job result already holds the dataset metadata, no need to fetch it again
+        unshuffled_dataset = (
+            avatarization_job.result.sensitive_unshuffled_avatars_datasets
+        )
+        unshuffled_dataset_id = unshuffled_dataset.id
         sensitive_unshuffled_avatars = (
             self.client.pandas_integration.download_dataframe(
-                str(avatarization_job.result.sensitive_unshuffled_avatars_datasets.id),
+                str(unshuffled_dataset_id),
+                dataset_info=unshuffled_dataset,
                 timeout=timeout,
             )
         )
-        for p in reversed(processors):
-            sensitive_unshuffled_avatars = p.postprocess(
-                request.df, sensitive_unshuffled_avatars
-            )
-        unshuffled_dataset = self.client.pandas_integration.upload_dataframe(
-            sensitive_unshuffled_avatars, timeout=timeout
-        )
+        if processors:
+            for p in reversed(processors):
+                sensitive_unshuffled_avatars = p.postprocess(
+                    request.df, sensitive_unshuffled_avatars
+                )
+            unshuffled_dataset_id = self.client.pandas_integration.upload_dataframe(
+                sensitive_unshuffled_avatars, timeout=timeout
+            ).id
 
         # Calculate privacy metrics on the post processed dataset vs the original one
         privacy_job = self.client.jobs.create_privacy_metrics_job(
             PrivacyMetricsJobCreate(
                 parameters=PrivacyMetricsParameters(
                     original_id=original_dataset_id,
-                    unshuffled_avatars_id=unshuffled_dataset.id,
+                    unshuffled_avatars_id=unshuffled_dataset_id,
                 )
             ),
             timeout=per_request_timeout,
         )
-        logger.info(f"launching privacy metrics job with id={privacy_job.id}")
+        logger.info("launching privacy metrics job with id=%s", privacy_job.id)
 
         # Calculate signal metrics
         signal_job = self.client.jobs.create_signal_metrics_job(
             SignalMetricsJobCreate(
                 parameters=SignalMetricsParameters(
-                    original_id=original_dataset_id, avatars_id=unshuffled_dataset.id
+                    original_id=original_dataset_id, avatars_id=unshuffled_dataset_id
                 )
             ),
             timeout=per_request_timeout,
         )
-        logger.info(f"launching signal metrics job with id={signal_job.id}")
+        logger.info("launching signal metrics job with id=%s", signal_job.id)
 
         # Get the job results
         signal_job = self.client.jobs.get_signal_metrics(
@@ -1521,14 +1551,16 @@ def upload_batch_and_get_order(
         batch_mapping:
             The index mapping for each dataset batch
     """
-    training_dataset = client.pandas_integration.upload_dataframe(
-        training, timeout=timeout
-    )
-
-    datasets_split_ids = [
-        client.pandas_integration.upload_dataframe(split, timeout=timeout).id
-        for split in splits
-    ]
+
+    def upload(df: pd.DataFrame) -> Dataset:
+        return client.pandas_integration.upload_dataframe(df, timeout=timeout)
+
+    # Batches are independent uploads, so they are sent concurrently.
+    # map() keeps the results in the order of the input batches.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_UPLOADS) as executor:
+        training_dataset, *split_datasets = executor.map(upload, [training, *splits])
+
+    datasets_split_ids = [dataset.id for dataset in split_datasets]
     batch_mapping: Dict[UUID, pd.Index] = {training_dataset.id: training.index}
     for dataset, dataframe in zip(datasets_split_ids, splits):
         batch_mapping[dataset] = dataframe.index
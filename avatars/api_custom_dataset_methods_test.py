@@ -1,8 +1,10 @@
 import io
+import json
 import os
 import tempfile
+import threading
 from pathlib import Path
-from typing import IO, Any, Dict, Iterator, Union
+from typing import IO, Any, Iterator, List, Union
 from unittest.mock import patch
 from uuid import uuid4
 
@@ -11,9 +13,9 @@ import pandas as pd
 import pyarrow.dataset as ds
 import pytest
 
-from avatars.api import Datasets, PandasIntegration
+from avatars.api import Datasets, PandasIntegration, upload_batch_and_get_order
 from avatars.conftest import RequestHandle, api_client_factory
-from avatars.models import Dataset, FileType
+from avatars.models import ColumnType, Dataset, FileType
 
 TEST_MAX_BYTES_PER_FILE = 1 * 1024  # 1 KB
 
@@ -32,6 +34,24 @@ def dataset_json() -> dict[str, Any]:
     }
 
 
+@pytest.fixture(scope="session")
+def dataset_json_content(dataset_json: dict[str, Any]) -> bytes:
+    # Serialized once, the handlers below return the same body for every request
+    return json.dumps(dataset_json).encode()
+
+
+@pytest.fixture(scope="session")
+def create_dataset_response(dataset_json_content: bytes) -> RequestHandle:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=dataset_json_content,
+            headers={"content-type": "application/json"},
+        )
+
+    return handler
+
+
 @pytest.fixture(scope="session")
 def csv_content() -> bytes:
     return b"a,b\n1,2"
@@ -44,17 +64,15 @@ def parquet_content(csv_content: bytes) -> bytes:
 
 
 class TestCustomCreateDatasetMethod:
-    @pytest.fixture(scope="session")
-    def create_dataset_response(self, dataset_json: dict[str, Any]) -> RequestHandle:
-        def handler(request: httpx.Request) -> httpx.Response:
-            return httpx.Response(200, json=dataset_json)
-
-        return handler
-
     @pytest.fixture(scope="session")
     def large_csv(self) -> bytes:
         return b"a,b\n" + b"1,2\n" * TEST_MAX_BYTES_PER_FILE
 
+    @pytest.fixture(scope="session")
+    def datasets(self) -> Datasets:
+        # Shared by the tests that fail argument validation before any request is sent
+        return Datasets(api_client_factory())
+
     @pytest.mark.parametrize("content_fixture_name", ["csv_content", "parquet_content"])
     def test_create_dataset_from_stream(
         self,
@@ -92,20 +110,21 @@ class TestCustomCreateDatasetMethod:
     @pytest.mark.filterwarnings(
         "ignore:request is deprecated:DeprecationWarning"
     )  # TODO: Remove
-    def test_create_dataset_both_request_and_source_raises(self) -> None:
-        client = api_client_factory()
+    def test_create_dataset_both_request_and_source_raises(
+        self, datasets: Datasets
+    ) -> None:
         with pytest.raises(ValueError, match="You cannot pass both request and source"):
-            Datasets(client).create_dataset(request=io.BytesIO(), source=io.BytesIO())
+            datasets.create_dataset(request=io.BytesIO(), source=io.BytesIO())
 
-    def test_create_dataset_neither_request_nor_source_raises(self) -> None:
-        client = api_client_factory()
+    def test_create_dataset_neither_request_nor_source_raises(
+        self, datasets: Datasets
+    ) -> None:
         with pytest.raises(ValueError, match="You need to pass in a source"):
-            Datasets(client).create_dataset()
+            datasets.create_dataset()
 
-    def test_create_dataset_with_unknown_source_type(self) -> None:
-        client = api_client_factory()
+    def test_create_dataset_with_unknown_source_type(self, datasets: Datasets) -> None:
         with pytest.raises(TypeError, match="Unsupported dataset source"):
-            Datasets(client).create_dataset(source=1)  # type: ignore[arg-type]
+            datasets.create_dataset(source=1)  # type: ignore[arg-type]
 
     @pytest.mark.parametrize("content_fixture_name", ["csv_content", "parquet_content"])
     def test_create_dataset_using_source_argument_with_filename(
@@ -285,8 +304,12 @@ def download_dataset_csv_response(csv_content: bytes) -> httpx.Response:
 
 
 @pytest.fixture(scope="session")
-def get_dataset_response(dataset_json: Dict[str, Any]) -> httpx.Response:
-    return httpx.Response(200, json=dataset_json)
+def get_dataset_response(dataset_json_content: bytes) -> httpx.Response:
+    return httpx.Response(
+        200,
+        content=dataset_json_content,
+        headers={"content-type": "application/json"},
+    )
 
 
 @pytest.fixture(scope="session")
@@ -295,18 +318,18 @@ def download_dataset_response(
     download_dataset_parquet_response: httpx.Response,
     download_dataset_csv_response: httpx.Response,
 ) -> RequestHandle:
+    # Download responses keyed by the requested filetype, CSV being the fallback
+    download_responses = {
+        FileType.parquet.value: download_dataset_parquet_response,
+        FileType.csv.value: download_dataset_csv_response,
+    }
+
     def handler(request: httpx.Request) -> httpx.Response:
-        is_download_dataset = "download" in request.url.path
-        is_get_dataset = not is_download_dataset and request.url.path.startswith(
-            "/datasets"
-        )
-        if is_download_dataset:
-            is_parquet_filetype = b"parquet" in request.url.query
-            if is_parquet_filetype:
-                return download_dataset_parquet_response
-            else:
-                return download_dataset_csv_response
-        elif is_get_dataset:
+        path = request.url.path
+        if "download" in path:
+            filetype = request.url.params.get("filetype")
+            return download_responses.get(filetype, download_dataset_csv_response)
+        elif path.startswith("/datasets"):
             return get_dataset_response
         else:
             raise ValueError("Unexpected request")
@@ -482,13 +505,6 @@ class TestPandasIntegrationUploadDataframe:
     def dataframe(self) -> pd.DataFrame:
         return pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
 
-    @pytest.fixture(scope="session")
-    def create_dataset_response(self, dataset_json: dict[str, Any]) -> RequestHandle:
-        def handler(request: httpx.Request) -> httpx.Response:
-            return httpx.Response(200, json=dataset_json)
-
-        return handler
-
     @pytest.mark.filterwarnings(
         "ignore:You are trying to upload a text file:DeprecationWarning"
     )
@@ -503,6 +519,42 @@ class TestPandasIntegrationUploadDataframe:
         assert isinstance(result, Dataset)
 
 
+class TestUploadBatchAndGetOrder:
+    def test_ids_keep_the_order_of_the_batches_when_uploads_finish_out_of_order(
+        self, dataset_json: dict[str, Any]
+    ) -> None:
+        training = pd.DataFrame({"a": [1, 2]})
+        splits = [pd.DataFrame({"a": [i]}, index=[i]) for i in range(3, 6)]
+        batches = [training, *splits]
+        ids = [uuid4() for _ in batches]
+        finished = [threading.Event() for _ in batches]
+        completion_order: List[int] = []
+
+        def upload_dataframe(df: pd.DataFrame, timeout: int) -> Dataset:
+            position = next(i for i, batch in enumerate(batches) if batch is df)
+            # Each upload waits for the next one, so the last batch finishes first
+            if position + 1 < len(batches):
+                assert finished[position + 1].wait(timeout=5)
+            completion_order.append(position)
+            finished[position].set()
+            return Dataset(**{**dataset_json, "id": str(ids[position])})
+
+        client = api_client_factory()
+        with patch.object(
+            client.pandas_integration, "upload_dataframe", side_effect=upload_dataframe
+        ):
+            training_id, split_ids, batch_mapping = upload_batch_and_get_order(
+                client, training, splits
+            )
+
+        assert completion_order == [3, 2, 1, 0]
+        assert training_id == ids[0]
+        assert split_ids == ids[1:]
+        assert list(batch_mapping) == ids
+        for dataset_id, batch in zip(ids, batches):
+            assert batch_mapping[dataset_id].equals(batch.index)
+
+
 class TestPandasIntegrationDownloadDataframe:
     @pytest.fixture
     def dataset(self, dataset_json: dict[str, Any]) -> Dataset:
@@ -531,3 +583,36 @@ class TestPandasIntegrationDownloadDataframe:
             )
 
         pd.testing.assert_frame_equal(result, dataframe)
+
+    def test_download_dataframe_casts_columns_to_their_dataset_types(
+        self, dataset_json: dict[str, Any]
+    ) -> None:
+        columns = [
+            {"label": "when", "type": ColumnType.datetime.value},
+            {"label": "kind", "type": ColumnType.category.value},
+            {"label": "count", "type": ColumnType.int.value},
+        ]
+        dataset_content = json.dumps({**dataset_json, "columns": columns}).encode()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "download" in request.url.path:
+                return httpx.Response(
+                    200,
+                    content=b"when,kind,count\n2024-01-01,a,1.0\n2024-01-02,b,2.0\n",
+                    headers={"content-type": "text/csv"},
+                )
+            return httpx.Response(
+                200,
+                content=dataset_content,
+                headers={"content-type": "application/json"},
+            )
+
+        client = api_client_factory(handler)
+
+        result = PandasIntegration(client).download_dataframe(dataset_json["id"])
+
+        assert result.dtypes.to_dict() == {
+            "when": "datetime64[ns]",
+            "kind": "object",
+            "count": "int64",
+        }
@@ -0,0 +1,263 @@
+import json
+import re
+from datetime import datetime
+from typing import Any, Dict, List
+from uuid import UUID, uuid4
+
+import httpx
+import pandas as pd
+import pytest
+
+from avatars.conftest import RequestHandle, api_client_factory
+from avatars.models import (
+    AvatarizationJobCreate,
+    AvatarizationParameters,
+    AvatarizationPipelineCreate,
+)
+
+PRIVACY_METRICS = {
+    "hidden_rate": 90.0,
+    "local_cloaking": 10.0,
+    "column_direct_match_protection": 100.0,
+    "row_direct_match_protection": 100.0,
+    "targets": {
+        name: "ok"
+        for name in [
+            "hidden_rate",
+            "local_cloaking",
+            "distance_to_closest",
+            "closest_distances_ratio",
+            "column_direct_match_protection",
+            "categorical_hidden_rate",
+            "row_direct_match_protection",
+            "correlation_protection_rate",
+            "inference_continuous",
+            "inference_categorical",
+            "closest_rate",
+        ]
+    },
+}
+
+SIGNAL_METRICS = {
+    "hellinger_mean": 0.1,
+    "hellinger_std": 0.01,
+    "targets": {"hellinger_mean": "ok", "correlation_difference_ratio": "ok"},
+}
+
+
+def dataset_json(id: Any) -> Dict[str, Any]:
+    return {
+        "id": str(id),
+        "hash": "hash",
+        "name": "upload",
+        "download_url": f"http://localhost:8000/datasets/{id}/download",
+        "nb_lines": 2,
+        "nb_dimensions": 2,
+        "filetype": "csv",
+        "columns": [],
+    }
+
+
+def job_json(kind: str, id: str, **fields: Any) -> Dict[str, Any]:
+    return {
+        "id": id,
+        "kind": kind,
+        "created_at": datetime(2024, 1, 1).isoformat(),
+        "status": "success",
+        **fields,
+    }
+
+
+class IdentityProcessor:
+    def preprocess(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.copy()
+
+    def postprocess(self, source: pd.DataFrame, dest: pd.DataFrame) -> pd.DataFrame:
+        return dest.copy()
+
+
+def make_pipeline_handler(
+    requests: List[httpx.Request], unshuffled_dataset_id: UUID
+) -> RequestHandle:
+    """Answer the requests of the avatarization pipeline, recording each of them."""
+    job_id = str(uuid4())
+    job_parameters: Dict[str, Any] = {}
+
+    def respond(content: Dict[str, Any]) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=json.dumps(content).encode(),
+            headers={"content-type": "application/json"},
+        )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        request.read()
+        requests.append(request)
+        method, path = request.method, request.url.path
+
+        if method == "POST" and path == "/datasets/stream":
+            return respond(dataset_json(uuid4()))
+        if method == "PATCH" and path.startswith("/datasets/"):
+            return respond(dataset_json(path.rsplit("/", 1)[-1]))
+        if method == "GET" and path.endswith("/download/stream"):
+            return httpx.Response(
+                200, content=b"a,b\n1,2\n3,4\n", headers={"content-type": "text/csv"}
+            )
+        if method == "GET" and re.fullmatch(r"/datasets/[^/]+", path):
+            return respond(dataset_json(path.rsplit("/", 1)[-1]))
+
+        if method == "POST" and path.startswith("/jobs/"):
+            job_parameters[path] = json.loads(request.content)["parameters"]
+        if path.endswith("avatarization") or path.startswith("/jobs/avatarization/"):
+            result = {
+                "avatars_dataset": dataset_json(uuid4()),
+                "sensitive_unshuffled_avatars_datasets": dataset_json(
+                    unshuffled_dataset_id
+                ),
+            }
+            parameters = job_parameters["/jobs/avatarization"]
+            return respond(
+                job_json("avatarization", job_id, parameters=parameters, result=result)
+            )
+        if path.endswith("/metrics/privacy"):
+            parameters = job_parameters["/jobs/metrics/privacy"]
+            return respond(
+                job_json(
+                    "privacy_metrics",
+                    job_id,
+                    parameters=parameters,
+                    result=PRIVACY_METRICS,
+                )
+            )
+        if path.endswith("/metrics/signal"):
+            parameters = job_parameters["/jobs/metrics/signal"]
+            return respond(
+                job_json(
+                    "signal_metrics",
+                    job_id,
+                    parameters=parameters,
+                    result=SIGNAL_METRICS,
+                )
+            )
+
+        raise AssertionError(f"Unexpected request: {method} {path}")
+
+    return handler
+
+
+def job_parameters_sent_to(requests: List[httpx.Request], path: str) -> Dict[str, Any]:
+    (request,) = [r for r in requests if r.method == "POST" and r.url.path == path]
+    parameters: Dict[str, Any] = json.loads(request.content)["parameters"]
+    return parameters
+
+
+def count_uploads(requests: List[httpx.Request]) -> int:
+    return len([r for r in requests if r.url.path == "/datasets/stream"])
+
+
+def uploaded_dataset_ids(requests: List[httpx.Request]) -> List[str]:
+    # Each upload is a stream followed by a patch of the created dataset's columns
+    return [r.url.path.rsplit("/", 1)[-1] for r in requests if r.method == "PATCH"]
+
+
+class TestPipelines:
+    @pytest.fixture
+    def df(self) -> pd.DataFrame:
+        return pd.DataFrame({"a": [1, 3], "b": [2, 4]})
+
+    @pytest.mark.filterwarnings(
+        "ignore:You are trying to upload a text file:DeprecationWarning"
+    )
+    def test_unshuffled_avatars_are_downloaded_without_fetching_the_dataset(
+        self, df: pd.DataFrame
+    ) -> None:
+        requests: List[httpx.Request] = []
+        unshuffled_dataset_id = uuid4()
+        client = api_client_factory(
+            make_pipeline_handler(requests, unshuffled_dataset_id)
+        )
+
+        result = client.pipelines.avatarization_pipeline_with_processors(
+            AvatarizationPipelineCreate(
+                avatarization_job_create=AvatarizationJobCreate(
+                    parameters=AvatarizationParameters(k=1, dataset_id=uuid4())
+                ),
+                df=df,
+            )
+        )
+
+        get_paths = [r.url.path for r in requests if r.method == "GET"]
+        assert f"/datasets/{unshuffled_dataset_id}" not in get_paths
+        assert f"/datasets/{unshuffled_dataset_id}/download/stream" in get_paths
+        pd.testing.assert_frame_equal(
+            result.post_processed_avatars.sort_values("a", ignore_index=True), df
+        )
+
+    @pytest.mark.filterwarnings(
+        "ignore:You are trying to upload a text file:DeprecationWarning"
+    )
+    def test_pipeline_without_processors_avatarizes_the_original_dataset(
+        self, df: pd.DataFrame
+    ) -> None:
+        requests: List[httpx.Request] = []
+        original_dataset_id, unshuffled_dataset_id = uuid4(), uuid4()
+        client = api_client_factory(
+            make_pipeline_handler(requests, unshuffled_dataset_id)
+        )
+
+        client.pipelines.avatarization_pipeline_with_processors(
+            AvatarizationPipelineCreate(
+                avatarization_job_create=AvatarizationJobCreate(
+                    parameters=AvatarizationParameters(
+                        k=1, dataset_id=original_dataset_id
+                    )
+                ),
+                df=df,
+            )
+        )
+
+        assert count_uploads(requests) == 0
+        avatarization = job_parameters_sent_to(requests, "/jobs/avatarization")
+        privacy = job_parameters_sent_to(requests, "/jobs/metrics/privacy")
+        signal = job_parameters_sent_to(requests, "/jobs/metrics/signal")
+        assert avatarization["dataset_id"] == str(original_dataset_id)
+        assert privacy["original_id"] == str(original_dataset_id)
+        assert privacy["unshuffled_avatars_id"] == str(unshuffled_dataset_id)
+        assert signal["original_id"] == str(original_dataset_id)
+        assert signal["avatars_id"] == str(unshuffled_dataset_id)
+
+    @pytest.mark.filterwarnings(
+        "ignore:You are trying to upload a text file:DeprecationWarning"
+    )
+    def test_pipeline_with_processors_uploads_the_processed_datasets(
+        self, df: pd.DataFrame
+    ) -> None:
+        requests: List[httpx.Request] = []
+        original_dataset_id, unshuffled_dataset_id = uuid4(), uuid4()
+        client = api_client_factory(
+            make_pipeline_handler(requests, unshuffled_dataset_id)
+        )
+
+        client.pipelines.avatarization_pipeline_with_processors(
+            AvatarizationPipelineCreate(
+                avatarization_job_create=AvatarizationJobCreate(
+                    parameters=AvatarizationParameters(
+                        k=1, dataset_id=original_dataset_id
+                    )
+                ),
+                processors=[IdentityProcessor()],
+                df=df,
+            )
+        )
+
+        # The preprocessed dataset, then the postprocessed avatars
+        assert count_uploads(requests) == 2
+        preprocessed_id, postprocessed_id = uploaded_dataset_ids(requests)
+        avatarization = job_parameters_sent_to(requests, "/jobs/avatarization")
+        privacy = job_parameters_sent_to(requests, "/jobs/metrics/privacy")
+        signal = job_parameters_sent_to(requests, "/jobs/metrics/signal")
+        assert avatarization["dataset_id"] == preprocessed_id
+        assert privacy["original_id"] == str(original_dataset_id)
+        assert privacy["unshuffled_avatars_id"] == postprocessed_id
+        assert signal["original_id"] == str(original_dataset_id)
+        assert signal["avatars_id"] == postprocessed_id
@@ -1,6 +1,7 @@
 import inspect
 import io
 import os
+import stat
 import struct
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -17,9 +18,9 @@ from typing import (
     Iterator,
     Optional,
     Union,
+    cast,
 )
 
-import clevercsv
 import pandas as pd
 import pyarrow as pa
 import pyarrow.csv as pcsv
@@ -41,7 +42,8 @@ SNIFF_SIZE = 1024 * 10
 
 
 BatchBytesFunction = Callable[[bytes], None]
-TableFunction = Callable[[pa.Table], None]
+# table_func receives the table, and optionally the total number of rows of the stream
+TableFunction = Union[Callable[[pa.Table], None], Callable[[pa.Table, int], None]]
 
 Stream = AsyncGenerator[bytes, None]
 FileLike = Union[BinaryIO, IO[Any], io.IOBase]
@@ -57,6 +59,8 @@ logger = structlog.get_logger(__name__)
 class FileInfo:
     fmt: Optional[str] = None
     error: list[str] = field(default_factory=list)
+    # Table parsed while probing the format, if the probe produced one
+    table: Optional[pa.Table] = None
 
 
 class StreamState(Enum):
@@ -66,22 +70,30 @@ class StreamState(Enum):
     DATA = "data"
 
 
+def get_nb_args(func: Optional[Callable[..., Any]]) -> int:
+    return len(inspect.signature(func).parameters) if func else 0
+
+
 def has_method(obj: Any, name: str) -> bool:
     return hasattr(obj, name) and callable(getattr(obj, name))
 
 
-def is_existing_file_or_dir(item: Any) -> Optional[Path]:
+def get_path_mode(item: Any) -> Optional[int]:
+    """Get the stat mode of a path with a single system call, None if it does not exist."""
     if isinstance(item, str):
-        p = Path(item)
-
-        if p.is_file() or p.is_dir():
-            return p
+        try:
+            return os.stat(item).st_mode
+        except (OSError, ValueError):
+            return None
 
     return None
 
 
 def is_file_like(obj: Any) -> bool:
-    return has_method(obj, "read") and has_method(obj, "write")
+    # Fast path for actual io objects, duck typing for wrappers such as TemporaryFileWrapper
+    return isinstance(obj, io.IOBase) or (
+        has_method(obj, "read") and has_method(obj, "write")
+    )
 
 
 def is_text_file(obj: Any) -> bool:
@@ -136,8 +148,9 @@ def try_format(finfo: FileInfo, fmt: str, obj: Any, func: Callable[[Any], Any])
 
     with save_pos(obj):
         try:
-            func(obj)
+            result = func(obj)
             finfo.fmt = fmt
+            finfo.table = result if isinstance(result, pa.Table) else None
             finfo.error.clear()
         except pa.ArrowInvalid as e:
             finfo.error = [fmt, str(e)]
@@ -271,6 +284,9 @@ class ArrowDatasetBuilder:
         else:
             sample = str(sample)
 
+        # Imported here as it is slow to import and only needed to sniff CSV sources
+        import clevercsv
+
         try:
             # Python csv module is really struggling on simple cases
             # CleverCSV seems to do a better job
@@ -289,6 +305,9 @@ class ArrowDatasetBuilder:
     def read_table(self, source: TableSource, finfo: FileInfo) -> pa.Table:
         if finfo.fmt == "csv":
             dialect = self.sniff_csv_data(source)
+            if dialect["delimiter"] == "," and finfo.table is not None:
+                # Format guessing already parsed the file with the default options
+                return finfo.table
             parse_options = pcsv.ParseOptions(delimiter=dialect["delimiter"])
             return pcsv.read_csv(source, parse_options=parse_options)  # type: ignore[arg-type]
         elif finfo.fmt == "parquet":
@@ -310,11 +329,12 @@ class ArrowDatasetBuilder:
         return self.read_table(source, finfo)
 
     def to_source(self, item: Any) -> Union[str, pa.Table]:
-        if p := is_existing_file_or_dir(item):
-            if p.is_file():
-                return self.to_table(item)
-            else:
-                return item  # type: ignore[no-any-return]
+        mode = get_path_mode(item)
+
+        if mode is not None and stat.S_ISREG(mode):
+            return self.to_table(item)
+        elif mode is not None and stat.S_ISDIR(mode):
+            return item  # type: ignore[no-any-return]
         elif is_text_file(item):
             # Let pyarrow open the file itself (in binary mode)
             return self.to_table(item.name)
@@ -344,6 +364,7 @@ class ArrowStreamReader:
     ) -> None:
         self.batch_bytes_func = batch_bytes_func
         self.table_func = table_func
+        self.table_func_nb_args = get_nb_args(table_func)
         self.func_stack: list[Any] = []
         self.batch = bytes()
         self.data = bytearray()
@@ -351,6 +372,12 @@ class ArrowStreamReader:
         self.stream_footer = MarkerWithSize(ARROW_END_OF_STREAM_MARKER)
         self.batch_header = MarkerWithSize(ARROW_BATCH_MARKER)
         self.state = StreamState.WAIT_STREAM_BEGIN
+        # Nothing is left to do once the stream end is reached
+        self.state_handlers: dict[StreamState, Callable[[], None]] = {
+            StreamState.WAIT_STREAM_BEGIN: self.wait_stream_begin,
+            StreamState.WAIT_BATCH: self.wait_batch,
+            StreamState.DATA: self.flush,
+        }
         self.nb_batches = 0
         self.total_rows = None
 
@@ -425,6 +452,8 @@ class ArrowStreamReader:
         self.push_funcs()
         self.batch_bytes_func = batch_bytes_func
         self.table_func = table_func
+        # Resolved once per stream rather than for every batch
+        self.table_func_nb_args = get_nb_args(table_func)
 
     def process_end(self) -> None:
         self.update_state()
@@ -449,29 +478,35 @@ class ArrowStreamReader:
         while True:
             prev_state = self.state
 
-            if self.state == StreamState.WAIT_STREAM_BEGIN:
-                self.try_load_header(self.stream_header, StreamState.WAIT_BATCH)
-                self.total_rows = self.stream_header.size  # type: ignore[assignment]
-            elif self.state == StreamState.WAIT_BATCH:
-                self.try_load_header(self.batch_header, StreamState.DATA)
-            elif self.state == StreamState.DATA:
-                self.flush()
+            handler = self.state_handlers.get(self.state)
+            if handler:
+                handler()
 
             if self.state == prev_state:
                 # No progress in this loop, need more data
                 break
 
+    def wait_stream_begin(self) -> None:
+        self.try_load_header(self.stream_header, StreamState.WAIT_BATCH)
+        self.total_rows = self.stream_header.size  # type: ignore[assignment]
+
+    def wait_batch(self) -> None:
+        self.try_load_header(self.batch_header, StreamState.DATA)
+
     def try_load_header(self, header: Marker, new_state: StreamState) -> None:
-        data = memoryview(self.data)
+        # The view must be released before skipping, as the buffer is resized in place
+        marker: Marker
+        with memoryview(self.data) as data:
+            if self.stream_footer.identify(data):
+                self.stream_footer.load(data)
+                # End of stream
+                marker, state = self.stream_footer, StreamState.AT_STREAM_END
+            elif header.try_load(data):
+                marker, state = header, new_state
+            else:
+                return
 
-        if self.stream_footer.identify(data):
-            self.stream_footer.load(data)
-            # End of stream
-            self.skip_marker_and_set_state(
-                self.stream_footer, StreamState.AT_STREAM_END
-            )
-        elif header.try_load(data):
-            self.skip_marker_and_set_state(header, new_state)
+        self.skip_marker_and_set_state(marker, state)
 
     def skip_marker_and_set_state(
         self, marker: MarkerBase, new_state: StreamState
@@ -502,10 +537,16 @@ class ArrowStreamReader:
         self.batch_header.size = 0
 
     def push_funcs(self) -> None:
-        self.func_stack.append([self.batch_bytes_func, self.table_func])
+        self.func_stack.append(
+            [self.batch_bytes_func, self.table_func, self.table_func_nb_args]
+        )
 
     def pop_funcs(self) -> None:
-        self.batch_bytes_func, self.table_func = self.func_stack.pop()
+        (
+            self.batch_bytes_func,
+            self.table_func,
+            self.table_func_nb_args,
+        ) = self.func_stack.pop()
 
     def call_funcs(self) -> None:
         if self.batch_bytes_func:
@@ -513,24 +554,26 @@ class ArrowStreamReader:
 
         if self.table_func:
             reader = pi.RecordBatchStreamReader(self.batch)  # type: ignore[call-arg]
-            nb_args = len(inspect.signature(self.table_func).parameters)
+            nb_args = self.table_func_nb_args
             if nb_args == 2:
-                self.table_func(  # type: ignore[call-arg]
+                cast(Callable[[pa.Table, int], None], self.table_func)(
                     reader.read_all(),
-                    self.total_rows,
+                    self.total_rows,  # type: ignore[arg-type]
                 )
             elif nb_args == 1:
-                self.table_func(reader.read_all())
+                cast(Callable[[pa.Table], None], self.table_func)(reader.read_all())
             else:
                 raise ValueError(
                     f"Expected 1 or 2 arguments for table_func, got {nb_args}"
                 )
 
     def skip_data(self, size: int) -> None:
-        self.data = self.data[size:]
+        # Drop the consumed bytes in place instead of copying the remainder
+        del self.data[:size]
 
     def extract_data(self, size: int) -> bytes:
-        return bytes(self.data[0:size])
+        with memoryview(self.data) as data:
+            return bytes(data[0:size])
 
     def no_data(self) -> bool:
         return len(self.data) == 0
@@ -0,0 +1,78 @@
+import io
+from typing import Any, List
+from unittest.mock import patch
+
+import pyarrow as pa
+import pyarrow.csv as pcsv
+import pyarrow.dataset as ds
+import pytest
+
+from avatars.arrow_utils import (
+    ArrowDatasetBuilder,
+    ArrowStreamReader,
+    ArrowStreamWriter,
+)
+
+
+@pytest.fixture
+def table() -> pa.Table:
+    return pa.table({"ints": list(range(25)), "strings": [str(i) for i in range(25)]})
+
+
+def stream_chunks(table: pa.Table, chunk_size: int = 7) -> List[bytes]:
+    """Serialize the table in small chunks to exercise partial markers and batches."""
+    dataset = ds.dataset(table)  # type: ignore[call-overload]
+    data = b"".join(ArrowStreamWriter(dataset, nb_rows_per_batch=10))
+    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+def test_stream_roundtrip_with_single_argument_table_func(table: pa.Table) -> None:
+    tables: List[pa.Table] = []
+
+    ArrowStreamReader().process_bytes(
+        iter(stream_chunks(table)), table_func=tables.append
+    )
+
+    assert len(tables) == 3
+    assert pa.concat_tables(tables).equals(table)
+
+
+def test_stream_roundtrip_with_total_rows_table_func(table: pa.Table) -> None:
+    calls: List[Any] = []
+
+    def table_func(batch: pa.Table, total_rows: int) -> None:
+        calls.append((batch.num_rows, total_rows))
+
+    ArrowStreamReader().process_bytes(iter(stream_chunks(table)), table_func=table_func)
+
+    assert calls == [(10, 25), (10, 25), (5, 25)]
+
+
+def test_stream_rejects_table_func_with_unexpected_arity(table: pa.Table) -> None:
+    def table_func(batch: pa.Table, total_rows: int, extra: int) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="Expected 1 or 2 arguments for table_func"):
+        ArrowStreamReader().process_bytes(
+            iter(stream_chunks(table)), table_func=table_func  # type: ignore[arg-type]
+        )
+
+
+def test_comma_separated_csv_is_parsed_once() -> None:
+    source = io.BytesIO(b"a,b\n1,x\n2,y\n")
+
+    with patch("avatars.arrow_utils.pcsv.read_csv", wraps=pcsv.read_csv) as read_csv:
+        table = ArrowDatasetBuilder().to_table(source)
+
+    assert read_csv.call_count == 1
+    assert table.column_names == ["a", "b"]
+    assert table.num_rows == 2
+
+
+def test_csv_with_other_delimiter_is_parsed_with_sniffed_delimiter() -> None:
+    source = io.BytesIO(b"a;b\n1;x\n2;y\n")
+
+    table = ArrowDatasetBuilder().to_table(source)
+
+    assert table.column_names == ["a", "b"]
+    assert table.num_rows == 2
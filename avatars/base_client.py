@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import itertools
 import os
+import threading
 import time
 from contextlib import ExitStack, contextmanager
 from copy import deepcopy
@@ -41,7 +42,7 @@ from avatars.arrow_utils import (
     is_text_file_or_buffer,
 )
 from avatars.models import JobStatus
-from avatars.utils import ContentType, ensure_valid, pop_or, remove_optionals, validated
+from avatars.utils import ContentType, ensure_valid, pop_or, remove_optionals
 
 logger = structlog.getLogger(__name__)
 structlog.configure(logger_factory=structlog.stdlib.LoggerFactory())
@@ -51,6 +52,7 @@ DEFAULT_RETRY_INTERVAL = 5
 DEFAULT_RETRY_COUNT = 20
 DEFAULT_TIMEOUT = 60 * 4
 DEFAULT_PER_CALL_TIMEOUT = 15
+DEFAULT_STREAM_CHUNK_SIZE = 1024 * 1024  # 1 MiB
 
 IN_PROGRESS_STATUSES = (JobStatus.pending, JobStatus.started)
 
@@ -60,6 +62,9 @@ DEFAULT_BINARY_CONTENT_TYPES = (
     ContentType.ARROW_STREAM,
 )
 DEFAULT_TEXT_CONTENT_TYPES = (ContentType.CSV, ContentType.JSON)
+CONTENT_TYPES_BY_VALUE = {
+    content_type.value: content_type for content_type in ContentType
+}
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -210,7 +215,8 @@ class ContextData:
     def build_params_arg(self) -> Optional[Dict[str, Any]]:
         return remove_optionals(self.params)
 
-    def build_json_data_arg(self) -> Optional[str]:
+    def build_json_data_arg(self) -> Optional[Dict[str, Any]]:
+        # Go through JSON so that non-finite floats are sent as null, not as invalid NaN
         return json_loads(self.json_data.model_dump_json()) if self.json_data else None
 
     def build_form_data_arg(self) -> Optional[Dict[str, Any]]:
@@ -263,7 +269,10 @@ class ContextData:
             self.http_request.headers.update(headers)
 
     def content_type(self) -> ContentType:
-        return ContentType(self.get_header("content-type").split(";")[0].strip())
+        # A plain dict lookup, unknown values do not go through Enum's failed lookup path
+        value = self.get_header("content-type").split(";")[0].strip()
+
+        return CONTENT_TYPES_BY_VALUE.get(value, ContentType.UNSUPPORTED)
 
     def is_created(self) -> bool:
         return self.status_is(httpx.codes.CREATED) and self.has_header("location")
@@ -286,16 +295,20 @@ class ContextData:
         return self.content_type() in DEFAULT_BINARY_CONTENT_TYPES
 
     def get_user_content(self) -> UserContent:
-        with validated(self.http_response, "response") as resp:
-            if self.should_stream:
-                return self.stream_response()
+        resp = ensure_valid(self.http_response, "response")
+
+        if self.should_stream:
+            return self.stream_response()
+        else:
+            # Parse the content-type header once for all the checks below
+            content_type = self.content_type()
+
+            if content_type == ContentType.JSON:
+                return self.response_to_json()
+            elif content_type in DEFAULT_BINARY_CONTENT_TYPES:
+                return resp.content
             else:
-                if self.is_content_json():
-                    return self.response_to_json()
-                elif self.is_content_binary():
-                    return resp.content
-                else:
-                    return resp.text
+                return resp.text
 
     def get_content_message(self) -> str:
         content = self.get_user_content()
@@ -323,21 +336,27 @@ class ContextData:
         return as_json
 
     def stream_response_content(self, destination: FileLike) -> None:
-        with validated(self.http_response, "response") as resp:
-            if self.is_content_arrow():
-                with ArrowStreamReader() as reader:
-                    reader.write_parquet(destination, resp.iter_bytes())
-            else:
-                try:
-                    if is_text_file_or_buffer(destination):
-                        for chunk in resp.iter_text():
-                            destination.write(chunk)  # type: ignore[call-overload]
-                    else:
-                        # Assume bytes...
-                        for chunk in resp.iter_bytes():  # type: ignore[assignment]
-                            destination.write(chunk)  # type: ignore[call-overload]
-                finally:
-                    resp.close()
+        resp = ensure_valid(self.http_response, "response")
+
+        if self.is_content_arrow():
+            with ArrowStreamReader() as reader:
+                reader.write_parquet(
+                    destination, resp.iter_bytes(DEFAULT_STREAM_CHUNK_SIZE)
+                )
+        else:
+            try:
+                # Write in large chunks rather than as many small network reads
+                if is_text_file_or_buffer(destination):
+                    for chunk in resp.iter_text(DEFAULT_STREAM_CHUNK_SIZE):
+                        destination.write(chunk)  # type: ignore[call-overload]
+                else:
+                    # Assume bytes...
+                    for chunk in resp.iter_bytes(  # type: ignore[assignment]
+                        DEFAULT_STREAM_CHUNK_SIZE
+                    ):
+                        destination.write(chunk)  # type: ignore[call-overload]
+            finally:
+                resp.close()
 
     def stream_response(
         self, destination: Optional[FileLike] = None
@@ -639,7 +658,7 @@ class BaseClient:
         verify_auth: bool = True,
         on_auth_refresh: Optional[AuthRefreshFunc] = None,
         http_client: Optional[httpx.Client] = None,
-        headers: Dict[str, str] = {},
+        headers: Optional[Dict[str, str]] = None,
     ) -> None:
         """Client to communicate with the Avatar API.
 
@@ -667,7 +686,25 @@ class BaseClient:
         self.verify_auth = verify_auth
         self._on_auth_refresh = on_auth_refresh
         self._http_client = http_client
-        self._headers = {"Avatars-Accept-Created": "yes"} | headers
+        self._http_client_lock = threading.Lock()
+        self._headers = {"Avatars-Accept-Created": "yes"} | (headers or {})
+
+    def get_http_client(self) -> httpx.Client:
+        """Get the HTTP client, creating it on first use.
+
+        The same client is reused for all requests so that connections are kept alive
+        and pooled instead of being opened for every request.
+        The creation is locked, as requests can be sent from several threads at once.
+        """
+        with self._http_client_lock:
+            if self._http_client is None:
+                self._http_client = httpx.Client(
+                    base_url=self.base_url,
+                    timeout=self.timeout,
+                    verify=self.should_verify_ssl,
+                )
+
+            return self._http_client
 
     def set_header(self, key: str, value: str) -> None:
         self._headers[key] = value
@@ -721,11 +758,7 @@ class BaseClient:
         self, *, ctx: Optional[ClientContext] = None, **kwargs: Any
     ) -> Generator[ClientContext, None, None]:
         with ExitStack() as stack:
-            http_client = self._http_client or httpx.Client(
-                base_url=self.base_url,
-                timeout=self.timeout,
-                verify=self.should_verify_ssl,
-            )
+            http_client = self.get_http_client()
 
             # Grab special keys
             headers: dict[str, Any] = pop_or(kwargs, "headers", {})
@@ -827,8 +860,7 @@ class BaseClient:
         **kwargs: Any,
     ) -> ResponseClass:
         with self.context(method="get", url=url) as ctx:
-            ctx.build_and_send_request()
-
+            # loop_until builds and sends the first status request itself
             info = ctx.loop_until(
                 label=f"get job at {url}",
                 update_func=update_response_op,
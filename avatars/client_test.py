@@ -1,13 +1,16 @@
+import json
 import unittest
-from typing import Any, Type
+from typing import Any, List, Type
 from unittest.mock import Mock, patch
 
 import httpx
 import pytest
+from pydantic import BaseModel
 
 from avatars.base_client import Timeout
 from avatars.client import ApiClient
 from avatars.conftest import RequestHandle, api_client_factory, mock_httpx_client
+from avatars.models import JobStatus
 
 
 @patch("httpx.Client")
@@ -37,6 +40,20 @@ def test_should_verify_ssl(mock_client: Any) -> None:
     mock_client.reset_mock()
 
 
+@patch("httpx.Client")
+def test_default_http_client_is_reused(mock_client: Any) -> None:
+    api_client = ApiClient(
+        base_url="https://test.com",
+        verify_auth=False,
+        should_verify_compatibility=False,
+    )
+
+    api_client.request("GET", "/health")
+    api_client.request("GET", "/health")
+
+    mock_client.assert_called_once()
+
+
 @pytest.mark.parametrize(
     "base_url",
     [
@@ -97,8 +114,11 @@ def prepare_api_client_for(resp: httpx.Response) -> ApiClient:
 class TestClientRequest:
     @pytest.fixture(scope="session")
     def json_ok_response(self) -> RequestHandle:
+        content = json.dumps({"message": "ok"}).encode()
+        headers = {"Content-Type": "application/json"}
+
         def handler(request: httpx.Request) -> httpx.Response:
-            return httpx.Response(200, json={"message": "ok"})
+            return httpx.Response(200, content=content, headers=headers)
 
         return handler
 
@@ -134,7 +154,7 @@ class TestClientRequest:
 
         with unittest.mock.patch(
             "avatars.base_client.DEFAULT_RETRY_COUNT", 1
-        ), unittest.mock.patch("avatars.base_client.DEFAULT_RETRY_INTERVAL", 0.1):
+        ), unittest.mock.patch("avatars.base_client.DEFAULT_RETRY_INTERVAL", 0):
             response = api_client.send_request(method="GET", url="/health")
 
         _, __, log = caplog.record_tuples[0]
@@ -207,7 +227,7 @@ class TestClientRequest:
         with unittest.mock.patch(
             "avatars.base_client.DEFAULT_RETRY_COUNT", 1
         ), unittest.mock.patch(
-            "avatars.base_client.DEFAULT_RETRY_INTERVAL", 0.1
+            "avatars.base_client.DEFAULT_RETRY_INTERVAL", 0
         ), pytest.raises(
             Timeout, match="Timeout waiting for GET on /health"
         ):
@@ -233,8 +253,42 @@ class TestClientRequest:
         with unittest.mock.patch(
             "avatars.base_client.DEFAULT_RETRY_COUNT", 1
         ), unittest.mock.patch(
-            "avatars.base_client.DEFAULT_RETRY_INTERVAL", 0.1
+            "avatars.base_client.DEFAULT_RETRY_INTERVAL", 0
         ), pytest.raises(
             httpx.RequestError, match="whatever"
         ):
             api_client.send_request(method="GET", url="/health")
+
+    def test_get_job_requests_finished_job_once(self) -> None:
+        """Verify that a job that is already finished is only fetched once."""
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"status": JobStatus.success.value})
+
+        class FinishedJob(BaseModel):
+            status: JobStatus
+
+        api_client = api_client_factory(handler)
+
+        job = api_client.get_job(url="/jobs/some-id", response_cls=FinishedJob)
+
+        assert job.status == JobStatus.success
+        assert len(requests) == 1
+
+    def test_json_body_sends_non_finite_floats_as_null(self) -> None:
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={})
+
+        class Body(BaseModel):
+            value: float
+
+        api_client = api_client_factory(handler)
+
+        api_client.request("POST", "/jobs", json_data=Body(value=float("nan")))
+
+        assert json.loads(requests[0].content) == {"value": None}
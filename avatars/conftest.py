@@ -1,17 +1,36 @@
+from datetime import datetime
 from typing import Callable, Optional
 
 import httpx
+import pandas as pd
+import pytest
 
 from avatars.client import ApiClient
 
 RequestHandle = Callable[[httpx.Request], httpx.Response]
 
+# Encoded once, the default handler builds a fresh response from it for every request
+_DEFAULT_EMPTY_CONTENT = b"{}"
+_DEFAULT_HEADERS = {"Content-Type": "application/json"}
+
+# Shared by the lib and processors tests, each test gets its own copy
+_MANY_DTYPES_DF = pd.DataFrame(
+    {
+        "ints": [-2, 0, 2, 3, 4, 5, 6],
+        "floats": [-2.1, 0.0, 2.1, 3.1, 4.1, 5.1, 6.1],
+        "strings": ["Mr", "John", "Doe", "Mrs.", "Mary", "Higgins", "Clark"],
+        "datetimes": pd.to_datetime([datetime(2022, 1, 1).replace(tzinfo=None)] * 7),
+    }
+)
+
 
 def mock_httpx_client(handler: Optional[RequestHandle] = None) -> httpx.Client:
     """Generate a HTTPX client with a MockTransport."""
 
     if handler is None:
-        handler = lambda request: httpx.Response(200, json={})  # noqa: E731
+        handler = lambda request: httpx.Response(  # noqa: E731
+            200, content=_DEFAULT_EMPTY_CONTENT, headers=_DEFAULT_HEADERS
+        )
 
     transport = httpx.MockTransport(handler)
     return httpx.Client(base_url="http://localhost:8000", transport=transport)
@@ -30,3 +49,8 @@ def api_client_factory(handler: Optional[RequestHandle] = None) -> ApiClient:
         verify_auth=False,
         should_verify_compatibility=False,
     )
+
+
+@pytest.fixture
+def many_dtypes_df() -> pd.DataFrame:
+    return _MANY_DTYPES_DF.copy()
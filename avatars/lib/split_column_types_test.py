@@ -1,5 +1,3 @@
-from datetime import datetime
-
 import numpy as np
 import pandas as pd
 import pytest
@@ -7,16 +5,6 @@ import pytest
 from avatars.lib.split_columns_types import split_columns_types
 
 
-@pytest.fixture
-def many_dtypes_df() -> pd.DataFrame:
-    df = pd.DataFrame()
-    df["ints"] = [-2, 0, 2, 3, 4, 5, 6]
-    df["floats"] = [-2.1, 0.0, 2.1, 3.1, 4.1, 5.1, 6.1]
-    df["strings"] = ["Mr", "John", "Doe", "Mrs.", "Mary", "Higgins", "Clark"]
-    df["datetimes"] = pd.to_datetime([datetime(2022, 1, 1).replace(tzinfo=None)] * 7)
-    return df
-
-
 def test_split_column_types(many_dtypes_df: pd.DataFrame) -> None:
     test_categorical = [2, 3]
     test_continuous = [0, 1]
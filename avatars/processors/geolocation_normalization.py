@@ -1,7 +1,8 @@
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, cast
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 
@@ -82,16 +83,21 @@ class GeolocationNormalizationProcessor:
         self.n_reference_lat = n_reference_lat
         self.n_bins = n_bins
         self.model: Dict[float, Dict[str, List[Tuple[float, float]]]] = {}
+        # Reference lats of the model in ascending order, to look up the closest one
+        self.sorted_refs: npt.NDArray[np.float64] = np.array([])
 
 
     def _compute_references(self, df: pd.DataFrame) -> pd.DataFrame:
         """Define reference latitudes and associate original points to each."""
+        lat, lon = self.latitude_variable, self.longitude_variable
+        # Compute the lat bounds once, they are used for the references and their spacing
+        lat_min, lat_max = df[lat].min(), df[lat].max()
 
         # Pick n lats along the lat range
-        reference_lats = np.linspace(min(df['lat']), max(df['lat']), self.n_reference_lat)
+        reference_lats = np.linspace(lat_min, lat_max, self.n_reference_lat)
 
         # align points to reference lats
-        delta_reference = (max(df['lat'])-min(df['lat'])) / (self.n_reference_lat-1)
+        delta_reference = (lat_max - lat_min) / (self.n_reference_lat-1)
         # points_to_reference_tolerance: defines which points are mapped to each lat reference.
         # points_to_reference_tolerance = 0 -> only points with the exact lat are mapped.
         # points_to_reference_tolerance = 0.2 -> points that are within 20% of the distance
@@ -104,8 +110,8 @@ class GeolocationNormalizationProcessor:
         ref_dfs = []  # copy of original df where lat is changed to the associated ref lat
         for ref_lat in reference_lats:
             # get points matching the ref with the given tolerance tol
-            tmp_df  = df[(df['lat'] >= (ref_lat - tol)) & (df['lat'] <= (ref_lat + tol))][['lat', 'lon']].copy()
-            tmp_df['lat'] = ref_lat # set lat as ref_lat
+            tmp_df  = df[(df[lat] >= (ref_lat - tol)) & (df[lat] <= (ref_lat + tol))][[lat, lon]].copy()
+            tmp_df[lat] = ref_lat # set lat as ref_lat
             ref_dfs.append(tmp_df)
         ref_df = pd.concat(ref_dfs).reset_index(drop=True)
 
@@ -116,14 +122,16 @@ class GeolocationNormalizationProcessor:
 
         # "Cut" values of each reference lat in `nbins` bins. A bin represent a portion of the lon
         # covered at that lat
-        for ref_lat in ref_df['lat'].unique():
+        # Group the points by reference lat once instead of filtering ref_df for each of them
+        lat, lon = self.latitude_variable, self.longitude_variable
+        for ref_lat, lons in ref_df.groupby(lat, sort=False)[lon]:
 
-            range_min = min(ref_df[ref_df['lat'] == ref_lat]['lon'])
-            range_max = max(ref_df[ref_df['lat'] == ref_lat]['lon'])
+            range_min = min(lons)
+            range_max = max(lons)
 
             # count number of points in each of the bin (i.e. each of the bin)
             pmf1, bin_edges = np.histogram(
-                    ref_df[ref_df['lat'] == ref_lat]['lon'],
+                    lons,
                     bins=nbins,
                     range=(range_min, range_max),
                     density=True,
@@ -138,56 +146,72 @@ class GeolocationNormalizationProcessor:
             # should sum to 1 for each reference lat.
             ranges_proportions = [(i/n_ranges, i/n_ranges + 1/n_ranges) for i in range(n_ranges)]
 
-            self.model[ref_lat] = {'ranges': ranges, 'ranges_proportions': ranges_proportions}
+            self.model[cast(float, ref_lat)] = {'ranges': ranges, 'ranges_proportions': ranges_proportions}
+
+    def _closest_reference(self, lat: float) -> float:
+        """Find the reference lat closest to lat, the lower one on ties."""
+        refs = self.sorted_refs
+        # Binary search for the neighbouring references instead of scanning all of them
+        idx = int(np.searchsorted(refs, lat))
+        if idx == 0:
+            return float(refs[0])
+        if idx == len(refs):
+            return float(refs[-1])
+
+        lower, upper = refs[idx - 1], refs[idx]
+        return float(lower if lat - lower <= upper - lat else upper)
 
     def _transform_one_point(self, row: pd.Series) -> pd.Series:
         # get closest reference lat for point to transform
-        refs = list(self.model.keys())
-        closest_ref = min(refs, key=lambda x:abs(x-row['lat']))
+        closest_ref = self._closest_reference(row[self.latitude_variable])
 
         # compute proportion value based on closest reference lat using the lon of
         # the point to. The proportion value is based on the range in which the original lon falls
         # and is a linear estimation calculated from start and end of the range
+        # Look up the model entry and the lon once, then unpack the matching ranges
+        model = self.model[closest_ref]
+        ranges, ranges_proportions = model['ranges'], model['ranges_proportions']
+        lon = row[self.longitude_variable]
+
         selected_i = -1
-        for i, r in enumerate(self.model[closest_ref]['ranges']):
-            if r[0] <= row['lon'] < r[1]:
+        for i, (range_start, range_end) in enumerate(ranges):
+            if range_start <= lon < range_end:
                 selected_i = i
                 break
 
-        min_val = self.model[closest_ref]['ranges'][selected_i][0]
-        max_val = self.model[closest_ref]['ranges'][selected_i][1]
-        proportion_of_val = (row['lon'] - min_val)/(max_val - min_val)
+        min_val, max_val = ranges[selected_i]
+        proportion_of_val = (lon - min_val)/(max_val - min_val)
 
-        min_val = self.model[closest_ref]['ranges_proportions'][selected_i][0]
-        max_val = self.model[closest_ref]['ranges_proportions'][selected_i][1]
+        min_val, max_val = ranges_proportions[selected_i]
         transformed_val = min_val + proportion_of_val * (max_val - min_val)
 
         x_transformed = row.copy()
-        x_transformed['lon'] = transformed_val
+        x_transformed[self.longitude_variable] = transformed_val
 
         return x_transformed
 
     def _inv_transform_one_point(self, row: pd.Series) -> pd.Series:
         # inverse transform follows the same logic as the transform (see _transform_one_point)
-        refs = list(self.model.keys())
-        closest_ref = min(refs, key=lambda x:abs(x-row['lat']))
+        closest_ref = self._closest_reference(row[self.latitude_variable])
+
+        model = self.model[closest_ref]
+        ranges, ranges_proportions = model['ranges'], model['ranges_proportions']
+        lon = row[self.longitude_variable]
 
         selected_i = -1
-        for i, r in enumerate(self.model[closest_ref]['ranges_proportions']):
-            if r[0] <= row['lon'] < r[1]:
+        for i, (range_start, range_end) in enumerate(ranges_proportions):
+            if range_start <= lon < range_end:
                 selected_i = i
                 break
 
-        min_val = self.model[closest_ref]['ranges_proportions'][selected_i][0]
-        max_val = self.model[closest_ref]['ranges_proportions'][selected_i][1]
-        proportion_of_val = (row['lon'] - min_val)/(max_val - min_val)
+        min_val, max_val = ranges_proportions[selected_i]
+        proportion_of_val = (lon - min_val)/(max_val - min_val)
 
-        min_val = self.model[closest_ref]['ranges'][selected_i][0]
-        max_val = self.model[closest_ref]['ranges'][selected_i][1]
+        min_val, max_val = ranges[selected_i]
         transformed_val = min_val + proportion_of_val * (max_val - min_val)
 
         x_inv_transformed = row.copy()
-        x_inv_transformed['lon'] = transformed_val
+        x_inv_transformed[self.longitude_variable] = transformed_val
 
         return x_inv_transformed
 
@@ -195,6 +219,7 @@ class GeolocationNormalizationProcessor:
     def _fit(self, df: pd.DataFrame) -> None:
         self.ref_df = self._compute_references(df)
         self._compute_ranges(self.ref_df, self.n_bins)
+        self.sorted_refs = np.sort(np.fromiter(self.model, dtype=float))
 
 
     def preprocess(self, df: pd.DataFrame) -> pd.DataFrame:
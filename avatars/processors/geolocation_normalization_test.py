@@ -1,39 +1,79 @@
+from pathlib import Path
+from typing import Tuple
+
 import numpy as np
 import pandas as pd
 import pytest
 
 from avatars.processors import GeolocationNormalizationProcessor
 
+FIXTURES_DIR = Path(__file__).parents[2] / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def porto_taxi_df() -> pd.DataFrame:
+    return pd.read_csv(FIXTURES_DIR / "porto_taxi_200.csv")
+
 
 @pytest.fixture
-def df() -> pd.DataFrame:
-    df = pd.read_csv("./fixtures/porto_taxi_200.csv")
-    return df
+def df(porto_taxi_df: pd.DataFrame) -> pd.DataFrame:
+    # The CSV is parsed once per session, each test gets its own copy
+    return porto_taxi_df.copy()
 
 
-def test_preprocess(df: pd.DataFrame) -> None:
+@pytest.fixture(scope="session")
+def fitted_processor(
+    porto_taxi_df: pd.DataFrame,
+) -> Tuple[GeolocationNormalizationProcessor, pd.DataFrame]:
+    # Preprocessing the whole fixture is the slow part, share the fitted processor and
+    # its output between tests
     processor = GeolocationNormalizationProcessor(
         latitude_variable='lat',
         longitude_variable='lon',
         n_reference_lat=10,
         n_bins=5)
-    processed_df = processor.preprocess(df=df)
+    return processor, processor.preprocess(df=porto_taxi_df.copy())
 
-    assert len(processed_df) == len(df)
 
+@pytest.fixture
+def preprocessed_porto_taxi_df(
+    fitted_processor: Tuple[GeolocationNormalizationProcessor, pd.DataFrame],
+) -> pd.DataFrame:
+    return fitted_processor[1].copy()
 
-def test_postprocess(df: pd.DataFrame) -> None:
-    processor = GeolocationNormalizationProcessor(
-        latitude_variable='lat',
-        longitude_variable='lon',
-        n_reference_lat=10,
-        n_bins=5)
+
+def test_preprocess(df: pd.DataFrame, preprocessed_porto_taxi_df: pd.DataFrame) -> None:
+    assert len(preprocessed_porto_taxi_df) == len(df)
+
+
+def test_postprocess(
+    df: pd.DataFrame,
+    fitted_processor: Tuple[GeolocationNormalizationProcessor, pd.DataFrame],
+) -> None:
+    processor, _ = fitted_processor
     random_points_df = df.sample(frac=0.25, replace=True).reset_index(drop=True)
     random_points_df['lon'] = np.random.uniform(0.0, 1.0, len(random_points_df))
 
-    processor.preprocess(df=df)
     postprocessed_df = processor.postprocess(source=df, dest=random_points_df)
 
     assert len(postprocessed_df) == len(random_points_df)
     assert min(postprocessed_df['lon']) >= min(df['lon'])
     assert max(postprocessed_df['lon']) <= max(df['lon'])
+
+
+def test_preprocess_with_custom_variable_names(
+    df: pd.DataFrame, preprocessed_porto_taxi_df: pd.DataFrame
+) -> None:
+    """Verify that the configured variable names are used instead of 'lat' and 'lon'."""
+    renamed = df.rename(columns={'lat': 'latitude', 'lon': 'longitude'})
+    processor = GeolocationNormalizationProcessor(
+        latitude_variable='latitude',
+        longitude_variable='longitude',
+        n_reference_lat=10,
+        n_bins=5)
+    processed_df = processor.preprocess(df=renamed)
+
+    np.testing.assert_array_equal(
+        processed_df['longitude'].to_numpy(),
+        preprocessed_porto_taxi_df['lon'].to_numpy(),
+    )
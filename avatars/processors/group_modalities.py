@@ -83,11 +83,10 @@ class GroupModalitiesProcessor:
 
     def preprocess(self, df: pd.DataFrame) -> pd.DataFrame:
         if self.variable_thresholds:
-            variables = self.variable_thresholds.keys()
-            if not all(elem in df.columns for elem in variables):
-                unknown_variables = [
-                    elem for elem in variables if elem not in df.columns
-                ]
+            unknown_variables = [
+                elem for elem in self.variable_thresholds if elem not in df.columns
+            ]
+            if unknown_variables:
                 raise ValueError(
                     "Expected valid variables in variable_thresholds",
                     f"got {unknown_variables} instead.",
@@ -112,8 +111,7 @@ class GroupModalitiesProcessor:
         # Apply the modality transformation
         if self.variable_thresholds:  # TODO: fix me for mypy
             count = {
-                x: df[x].value_counts().to_dict()
-                for x in self.variable_thresholds.keys()
+                x: df[x].value_counts().to_dict() for x in self.variable_thresholds
             }
             correspondence = {
                 key: {
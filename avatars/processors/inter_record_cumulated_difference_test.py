@@ -200,61 +200,49 @@ def test_preprocess_raises_error_when_missing_dest_difference_var(
         processor.postprocess(df_with_cumulated, preprocessed_df_with_cumulated)
 
 
-def test_preprocess_raises_error_when_wrong_id_var(
-    df_with_cumulated: pd.DataFrame,
+@pytest.mark.parametrize("argument_name", ["id_variable", "target_variable"])
+def test_preprocess_raises_error_when_wrong_var(
+    df_with_cumulated: pd.DataFrame, argument_name: str
 ) -> None:
-    processor = InterRecordCumulatedDifferenceProcessor(
-        id_variable="wrong_id",
+    # all the correct arguments, that should pass without errors
+    arguments = dict(
+        id_variable="id",
         target_variable="value",
         new_first_variable_name="first_value",
         new_difference_variable_name="value_difference",
     )
 
-    with pytest.raises(ValueError, match="Expected a valid `id_variable`"):
-        processor.preprocess(df_with_cumulated)
+    # assign a wrong value to one of the argument
+    arguments[argument_name] = "wrong_value"
 
+    processor = InterRecordCumulatedDifferenceProcessor(**arguments)  # type: ignore[arg-type]
 
-def test_preprocess_raises_error_when_wrong_target_var(
-    df_with_cumulated: pd.DataFrame,
-) -> None:
-    processor = InterRecordCumulatedDifferenceProcessor(
-        id_variable="id",
-        target_variable="wrong_value",
-        new_first_variable_name="first_value",
-        new_difference_variable_name="value_difference",
-    )
-
-    with pytest.raises(ValueError, match="Expected a valid `target_variable`"):
+    with pytest.raises(ValueError, match=f"Expected a valid `{argument_name}`"):
         processor.preprocess(df_with_cumulated)
 
 
-def test_postprocess_raises_error_when_wrong_first_var(
-    df_with_cumulated: pd.DataFrame, preprocessed_df_with_cumulated: pd.DataFrame
+@pytest.mark.parametrize(
+    "argument_name", ["new_first_variable_name", "new_difference_variable_name"]
+)
+def test_postprocess_raises_error_when_wrong_var(
+    df_with_cumulated: pd.DataFrame,
+    preprocessed_df_with_cumulated: pd.DataFrame,
+    argument_name: str,
 ) -> None:
-    processor = InterRecordCumulatedDifferenceProcessor(
+    # all the correct arguments, that should pass without errors
+    arguments = dict(
         id_variable="id",
         target_variable="value",
-        new_first_variable_name="wrong_first_value",
+        new_first_variable_name="first_value",
         new_difference_variable_name="value_difference",
     )
 
-    with pytest.raises(ValueError, match="Expected a valid `new_first_variable_name`"):
-        processor.postprocess(df_with_cumulated, preprocessed_df_with_cumulated)
+    # assign a wrong value to one of the argument
+    arguments[argument_name] = "wrong_value"
 
+    processor = InterRecordCumulatedDifferenceProcessor(**arguments)  # type: ignore[arg-type]
 
-def test_postprocess_raises_error_when_wrong_difference_var(
-    df_with_cumulated: pd.DataFrame, preprocessed_df_with_cumulated: pd.DataFrame
-) -> None:
-    processor = InterRecordCumulatedDifferenceProcessor(
-        id_variable="id",
-        target_variable="value",
-        new_first_variable_name="first_value",
-        new_difference_variable_name="wrong_value_difference",
-    )
-
-    with pytest.raises(
-        ValueError, match="Expected a valid `new_difference_variable_name`"
-    ):
+    with pytest.raises(ValueError, match=f"Expected a valid `{argument_name}`"):
         processor.postprocess(df_with_cumulated, preprocessed_df_with_cumulated)
 
 
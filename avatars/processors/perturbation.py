@@ -76,7 +76,7 @@ class PerturbationProcessor:
         if not self.perturbation_level:
             return dest
 
-        missing_keys = set(self.perturbation_level.keys()).difference(source.columns)
+        missing_keys = set(self.perturbation_level).difference(source.columns)
         if missing_keys:
             raise ValueError(
                 "perturbation_level",
@@ -1,3 +1,5 @@
+import re
+
 import numpy as np
 import pandas as pd
 import pandas.testing as pd_testing
@@ -88,8 +90,10 @@ def test_preprocess_wrong_reference() -> None:
     )
     with pytest.raises(
         ValueError,
-        match="('variable_name', "
-        "'variable wrong_variable cannot be found in the dataframe variables')",
+        match=re.escape(
+            "('variable_name', "
+            "'variable wrong_variable cannot be found in the dataframe variables')"
+        ),
     ):
         processor.preprocess(ORIGINAL_DF)
 
@@ -102,8 +106,10 @@ def test_postprocess_wrong_reference() -> None:
     )
     with pytest.raises(
         ValueError,
-        match="('variable_name', "
-        "'variable wrong_variable cannot be found in the dataframe variables')",
+        match=re.escape(
+            "('variable_name', "
+            "'variable wrong_variable cannot be found in the dataframe variables')"
+        ),
     ):
         processor.postprocess(ORIGINAL_DF, ORIGINAL_DF)
 
@@ -40,11 +40,14 @@ def test_preprocess_to_categorical(original: pd.DataFrame) -> None:
     pd_testing.assert_frame_equal(expected, processed)
 
 
-def test_processor_to_categorical(original: pd.DataFrame) -> None:
-    """Verify that pre- and post-process, with keep_continuous=False, gives original."""
+@pytest.mark.parametrize("keep_continuous", [False, True])
+def test_processor_to_categorical(
+    original: pd.DataFrame, keep_continuous: bool
+) -> None:
+    """Verify that pre- and post-process, with or without keep_continuous, gives original."""
     expected = original.copy()
     processor = ToCategoricalProcessor(
-        to_categorical_threshold=2, keep_continuous=False
+        to_categorical_threshold=2, keep_continuous=keep_continuous
     )
     processed_df = processor.preprocess(df=original)
     df = processor.postprocess(source=original, dest=processed_df)
@@ -52,15 +55,6 @@ def test_processor_to_categorical(original: pd.DataFrame) -> None:
     pd_testing.assert_frame_equal(df, expected)
 
 
-def test_processor_to_categorical_keep_continuous(original: pd.DataFrame) -> None:
-    """Verify that pre- and post-process, with keep_continuous=True, gives original."""
-    expected = original.copy()
-    processor = ToCategoricalProcessor(to_categorical_threshold=2, keep_continuous=True)
-    processed_df = processor.preprocess(df=original)
-    df = processor.postprocess(source=original, dest=processed_df)
-    pd_testing.assert_frame_equal(df, expected)
-
-
 def test_postprocessed_with_category(original: pd.DataFrame) -> None:
     """Check post processor with a transformed variable changed the categorical variable.
 
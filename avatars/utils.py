@@ -4,8 +4,6 @@ from contextlib import contextmanager
 from enum import Enum
 from typing import Any, Generator, Optional, TypeVar
 
-from toolz.dicttoolz import valfilter, valmap
-
 T = TypeVar("T")
 U = TypeVar("U")
 R = TypeVar("R")
@@ -51,7 +49,11 @@ def pop_or(content: dict[str, Any], key: str, default: T) -> T:
 def remove_optionals(params: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
     if params:
         # Remove params if they are set to None (allow handling of optionals)
-        params = valfilter(lambda x: x is not None, params)
-        params = valmap(lambda x: x.value if isinstance(x, Enum) else x, params)
+        # and replace enums by their values, in a single pass
+        params = {
+            k: v.value if isinstance(v, Enum) else v
+            for k, v in params.items()
+            if v is not None
+        }
 
     return params